@@ -7,11 +7,22 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from typing import Optional
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 
 BASE_URL = "https://api.anthropic.com/v1"
 
 
+def _iso_utc(dt: datetime) -> str:
+    """Format a naive UTC datetime as ISO 8601 with a Z suffix."""
+    return dt.replace(microsecond=0).isoformat() + "Z"
+
+
 @dataclass
 class UsageData:
     """Container for usage statistics."""
@@ -49,14 +60,15 @@ class AnthropicAdminAPI:
 
     def __init__(self, admin_api_key: str):
         self.api_key = admin_api_key
+        self._friendly_cache: dict[str, str] = {}
         self.session = requests.Session()
         self.session.headers.update({
             "x-api-key": admin_api_key,
             "anthropic-version": "2023-06-01",
         })
 
-    def _get_date_range(self, timeframe: str) -> tuple[str, str]:
-        """Get start and end dates for a timeframe in ISO 8601 format."""
+    def _get_date_range(self, timeframe: str) -> tuple[datetime, datetime]:
+        """Get start and end datetimes (UTC) for a timeframe."""
         now = datetime.utcnow()
         today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
@@ -73,7 +85,7 @@ class AnthropicAdminAPI:
             start = today_start
             end = now
 
-        return start.strftime("%Y-%m-%dT%H:%M:%SZ"), end.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return start, end
 
     def get_usage(self, timeframe: str = "today") -> Optional[dict]:
         """
@@ -84,17 +96,19 @@ class AnthropicAdminAPI:
         - by_model: list[ModelUsage]
         - by_key: list[ApiKeyUsage]
         """
-        start_date, end_date = self._get_date_range(timeframe)
+        start, end = self._get_date_range(timeframe)
 
         try:
-            # Fetch usage grouped by model
-            model_usage = self._fetch_usage(start_date, end_date, group_by="model")
-
-            # Fetch usage grouped by API key
-            key_usage = self._fetch_usage(start_date, end_date, group_by="api_key_id")
+            # The three reports are independent, so overlap their round trips.
+            # _fetch_cost swallows its own errors and returns [] on failure.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                f_model = executor.submit(self._fetch_usage, start, end, "model")
+                f_key = executor.submit(self._fetch_usage, start, end, "api_key_id")
+                f_cost = executor.submit(self._fetch_cost, start, end)
 
-            # Fetch cost data
-            cost_data = self._fetch_cost(start_date, end_date)
+                model_usage = f_model.result()
+                key_usage = f_key.result()
+                cost_data = f_cost.result()
 
             return self._combine_data(model_usage, key_usage, cost_data)
 
@@ -102,13 +116,13 @@ class AnthropicAdminAPI:
             print(f"API request failed: {e}")
             return None
 
-    def _fetch_usage(self, start_date: str, end_date: str, group_by: str = None) -> list:
+    def _fetch_usage(self, start: datetime, end: datetime, group_by: str = None) -> list:
         """Fetch usage from the messages usage report endpoint."""
         url = f"{BASE_URL}/organizations/usage_report/messages"
 
         params = {
-            "starting_at": start_date,
-            "ending_at": end_date,
+            "starting_at": _iso_utc(start),
+            "ending_at": _iso_utc(end),
             "bucket_width": "1d",
         }
 
@@ -118,31 +132,27 @@ class AnthropicAdminAPI:
         response = self.session.get(url, params=params)
         response.raise_for_status()
 
-        data = response.json()
+        data = _json.loads(response.content)
         return data.get("data", [])
 
-    def _fetch_cost(self, start_date: str, end_date: str) -> list:
+    def _fetch_cost(self, start: datetime, end: datetime) -> list:
         """Fetch cost data from the cost report endpoint."""
         url = f"{BASE_URL}/organizations/cost_report"
 
-        # Cost endpoint requires full day boundaries
-        # Parse dates and adjust to full days
-        start_dt = datetime.strptime(start_date, "%Y-%m-%dT%H:%M:%SZ")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%dT%H:%M:%SZ")
-
-        # Start at beginning of start day, end at end of end day
-        start_day = start_dt.replace(hour=0, minute=0, second=0)
-        end_day = (end_dt + timedelta(days=1)).replace(hour=0, minute=0, second=0)
+        # Cost endpoint requires full day boundaries:
+        # start at beginning of start day, end at end of end day
+        start_day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_day = (end + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
 
         params = {
-            "starting_at": start_day.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "ending_at": end_day.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "starting_at": _iso_utc(start_day),
+            "ending_at": _iso_utc(end_day),
         }
 
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = _json.loads(response.content)
             return data.get("data", [])
         except Exception:
             # If cost fetch fails, return empty - usage still works
@@ -223,14 +233,23 @@ class AnthropicAdminAPI:
         return result
 
     def _friendly_model_name(self, model: str) -> str:
-        """Convert model ID to friendly name."""
-        if "opus" in model.lower():
-            return "Opus"
-        elif "sonnet" in model.lower():
-            return "Sonnet"
-        elif "haiku" in model.lower():
-            return "Haiku"
-        return model
+        """Convert model ID to friendly name (memoized per model ID)."""
+        cached = self._friendly_cache.get(model)
+        if cached is not None:
+            return cached
+
+        lowered = model.lower()
+        if "opus" in lowered:
+            name = "Opus"
+        elif "sonnet" in lowered:
+            name = "Sonnet"
+        elif "haiku" in lowered:
+            name = "Haiku"
+        else:
+            name = model
+
+        self._friendly_cache[model] = name
+        return name
 
     def test_connection(self) -> tuple[bool, str]:
         """Test if the API key is valid."""
@@ -241,8 +260,8 @@ class AnthropicAdminAPI:
             response = self.session.get(
                 f"{BASE_URL}/organizations/usage_report/messages",
                 params={
-                    "starting_at": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                    "ending_at": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "starting_at": _iso_utc(start),
+                    "ending_at": _iso_utc(now),
                     "bucket_width": "1d",
                 }
             )
@@ -275,78 +294,3 @@ def format_cost(amount: float) -> str:
     if amount >= 1000:
         return f"${amount:,.0f}"
     return f"${amount:.2f}"
-
-
-def get_oauth_usage() -> Optional[dict]:
-    """
-    Fetch usage limits from Claude Code OAuth endpoint.
-    Returns session utilization percentages and reset times.
-    """
-    import subprocess
-    import json
-
-    try:
-        # Get OAuth token from macOS Keychain
-        result = subprocess.run(
-            ["security", "find-generic-password", "-s", "Claude Code-credentials", "-w"],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            return None
-
-        creds = json.loads(result.stdout.strip())
-        token = creds.get("claudeAiOauth", {}).get("accessToken")
-        if not token:
-            return None
-
-        # Fetch usage from OAuth endpoint
-        resp = requests.get(
-            "https://api.anthropic.com/api/oauth/usage",
-            headers={
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {token}",
-                "anthropic-beta": "oauth-2025-04-20",
-                "User-Agent": "claude-code/2.1.34",
-            },
-            timeout=10
-        )
-
-        if resp.status_code != 200:
-            return None
-
-        return resp.json()
-
-    except Exception as e:
-        print(f"OAuth usage fetch failed: {e}")
-        return None
-
-
-def format_reset_time(iso_time: str | None) -> str:
-    """Format ISO timestamp to friendly reset time."""
-    if not iso_time:
-        return "--"
-
-    from datetime import datetime
-    import re
-
-    try:
-        # Parse ISO format with timezone
-        clean = re.sub(r'\.\d+', '', iso_time)  # Remove microseconds
-        dt = datetime.fromisoformat(clean.replace('+00:00', '+0000'))
-
-        now = datetime.now(dt.tzinfo)
-        diff = dt - now
-
-        if diff.days == 0:
-            hours = diff.seconds // 3600
-            mins = (diff.seconds % 3600) // 60
-            if hours > 0:
-                return f"{hours}h {mins}m"
-            return f"{mins}m"
-        elif diff.days == 1:
-            return "Tomorrow"
-        else:
-            return dt.strftime("%b %d")
-    except:
-        return "?"
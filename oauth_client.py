@@ -0,0 +1,166 @@
+"""
+Claude Code OAuth usage client shared by tracker.py and tracker_lite.py.
+"""
+
+import re
+import subprocess
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from datetime import datetime
+from typing import Optional
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+OAUTH_USAGE_URL = "https://api.anthropic.com/api/oauth/usage"
+OAUTH_TOKEN_TTL = 3600  # seconds before re-reading the token from Keychain
+OAUTH_USAGE_TTL = 30  # seconds; below the 60s auto-refresh so ticks still update
+
+# Fractional seconds in API timestamps, stripped before parsing
+_MICRO_RE = re.compile(r"\.\d+")
+
+
+def _make_session() -> requests.Session:
+    """Create a keep-alive session for the OAuth usage endpoint."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "anthropic-beta": "oauth-2025-04-20",
+        "User-Agent": "claude-code/2.1.34",
+    })
+    return session
+
+
+# Reused across refreshes so the TLS handshake only happens once
+_session = _make_session()
+
+
+def get_session() -> requests.Session:
+    """Return the shared OAuth usage session."""
+    return _session
+
+
+_token_cache = {"token": None, "fetched_at": 0.0}
+
+
+def _get_oauth_token() -> Optional[str]:
+    """Return the Claude Code OAuth token, cached to avoid spawning `security` every refresh."""
+    token = _token_cache["token"]
+    if token and time.monotonic() - _token_cache["fetched_at"] < OAUTH_TOKEN_TTL:
+        return token
+
+    # Get OAuth token from macOS Keychain
+    result = subprocess.run(
+        ["security", "find-generic-password", "-s", "Claude Code-credentials", "-w"],
+        capture_output=True
+    )
+    if result.returncode != 0:
+        return None
+
+    creds = _json.loads(result.stdout)
+    token = creds.get("claudeAiOauth", {}).get("accessToken")
+    if not token:
+        return None
+
+    _token_cache["token"] = token
+    _token_cache["fetched_at"] = time.monotonic()
+    return token
+
+
+def _invalidate_oauth_token():
+    """Forget the cached OAuth token so the next call re-reads Keychain."""
+    _token_cache["token"] = None
+    _token_cache["fetched_at"] = 0.0
+
+
+_usage_cache = {"at": 0.0, "fetched_at": None, "data": None}
+
+
+def get_oauth_usage() -> Optional[dict]:
+    """
+    Fetch usage limits from Claude Code OAuth endpoint.
+    Returns session utilization percentages and reset times.
+
+    Responses are cached for OAUTH_USAGE_TTL seconds so rapid refreshes
+    coalesce.
+    """
+    if _usage_cache["data"] is not None:
+        if time.monotonic() - _usage_cache["at"] < OAUTH_USAGE_TTL:
+            return _usage_cache["data"]
+
+    try:
+        token = _get_oauth_token()
+        if not token:
+            return None
+
+        # Fetch usage from OAuth endpoint
+        resp = get_session().get(
+            OAUTH_USAGE_URL,
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=10
+        )
+
+        # Token may have been refreshed by Claude Code; re-read it once
+        if resp.status_code == 401:
+            _invalidate_oauth_token()
+            token = _get_oauth_token()
+            if not token:
+                return None
+            resp = get_session().get(
+                OAUTH_USAGE_URL,
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=10
+            )
+
+        if resp.status_code != 200:
+            return None
+
+        data = _json.loads(resp.content)
+        _usage_cache["at"] = time.monotonic()
+        _usage_cache["fetched_at"] = datetime.now()
+        _usage_cache["data"] = data
+        return data
+
+    except Exception as e:
+        print(f"OAuth usage fetch failed: {e}")
+        return None
+
+
+def get_last_fetch_time() -> Optional[datetime]:
+    """Return the wall-clock time of the last successful usage fetch."""
+    return _usage_cache["fetched_at"]
+
+
+def format_reset_time(iso_time: str | None) -> str:
+    """Format ISO timestamp to friendly reset time."""
+    if not iso_time:
+        return "--"
+
+    try:
+        # Parse ISO format with timezone
+        clean = _MICRO_RE.sub('', iso_time)  # Remove microseconds
+        dt = datetime.fromisoformat(clean.replace('+00:00', '+0000'))
+
+        now = datetime.now(dt.tzinfo)
+        diff = dt - now
+
+        if diff.days == 0:
+            hours = diff.seconds // 3600
+            mins = (diff.seconds % 3600) // 60
+            if hours > 0:
+                return f"{hours}h {mins}m"
+            return f"{mins}m"
+        elif diff.days == 1:
+            return "Tomorrow"
+        else:
+            return dt.strftime("%b %d")
+    except:
+        return "?"
@@ -4,10 +4,9 @@ Claude Usage Tracker - macOS Menu Bar App
 """
 
 import rumps
-from datetime import datetime
 
 from config import get_api_key, set_keychain_key
-from anthropic_api import get_oauth_usage, format_reset_time
+from oauth_client import get_oauth_usage, get_last_fetch_time, format_reset_time
 
 
 class ClaudeUsageTracker(rumps.App):
@@ -16,6 +15,7 @@ class ClaudeUsageTracker(rumps.App):
         super().__init__(name="Claude Usage", title="...", quit_button=None)
         self.usage = None
         self.last_refresh = None
+        self._last_titles = {}
         self._build_menu()
         self._refresh_data(None)
 
@@ -53,55 +53,59 @@ class ClaudeUsageTracker(rumps.App):
     def _auto_refresh(self, _):
         self._refresh_data(None)
 
-    def _refresh_data(self, _):
-        self.title = "..."
+    def _set_title(self, item, key, title):
+        """Update a title only if it changed, to avoid redundant Cocoa updates."""
+        if self._last_titles.get(key) != title:
+            item.title = title
+            self._last_titles[key] = title
 
+    def _refresh_data(self, _):
         try:
             self.usage = get_oauth_usage()
-            self.last_refresh = datetime.now()
+            self.last_refresh = get_last_fetch_time()
             self._update_display()
         except Exception as e:
-            self.title = "Err"
+            self._set_title(self, "app", "Err")
             print(f"Error: {e}")
 
     def _update_display(self):
         if not self.usage:
-            self.title = "?"
+            self._set_title(self, "app", "?")
             return
 
         # Menu bar title: show 5-hour percentage
         five_hr = self.usage.get("five_hour")
         if five_hr:
             pct = int(five_hr.get("utilization", 0))
-            self.title = f"{pct}%"
+            self._set_title(self, "app", f"{pct}%")
         else:
-            self.title = "0%"
+            self._set_title(self, "app", "0%")
 
         # 5-hour session
         if five_hr:
             pct = int(five_hr.get("utilization", 0))
             reset = format_reset_time(five_hr.get("resets_at", ""))
-            self.menu_5hr.title = f"5-hour: {pct}% (resets {reset})"
+            self._set_title(self.menu_5hr, "5hr", f"5-hour: {pct}% (resets {reset})")
         else:
-            self.menu_5hr.title = "5-hour: --"
+            self._set_title(self.menu_5hr, "5hr", "5-hour: --")
 
         # 7-day
         seven_day = self.usage.get("seven_day")
         if seven_day:
             pct = int(seven_day.get("utilization", 0))
             reset = format_reset_time(seven_day.get("resets_at", ""))
-            self.menu_7day.title = f"Weekly: {pct}% (resets {reset})"
+            self._set_title(self.menu_7day, "7day", f"Weekly: {pct}% (resets {reset})")
         else:
-            self.menu_7day.title = "Weekly: --"
+            self._set_title(self.menu_7day, "7day", "Weekly: --")
 
         # Sonnet weekly
         sonnet = self.usage.get("seven_day_sonnet")
         if sonnet:
             pct = int(sonnet.get("utilization", 0))
             reset = format_reset_time(sonnet.get("resets_at", ""))
-            self.menu_sonnet.title = f"Sonnet: {pct}% (resets {reset})"
+            self._set_title(self.menu_sonnet, "sonnet", f"Sonnet: {pct}% (resets {reset})")
         else:
-            self.menu_sonnet.title = "Sonnet: --"
+            self._set_title(self.menu_sonnet, "sonnet", "Sonnet: --")
 
         # Extra usage
         extra = self.usage.get("extra_usage")
@@ -109,13 +113,13 @@ class ClaudeUsageTracker(rumps.App):
             used = extra.get("used_credits", 0) / 100  # cents to dollars
             limit = extra.get("monthly_limit", 0) / 100
             pct = int(extra.get("utilization", 0))
-            self.menu_extra.title = f"Extra: ${used:.2f}/${limit:.0f} ({pct}%)"
+            self._set_title(self.menu_extra, "extra", f"Extra: ${used:.2f}/${limit:.0f} ({pct}%)")
         else:
-            self.menu_extra.title = "Extra: disabled"
+            self._set_title(self.menu_extra, "extra", "Extra: disabled")
 
         # Updated time
         if self.last_refresh:
-            self.menu_updated.title = f"Updated: {self.last_refresh.strftime('%H:%M:%S')}"
+            self._set_title(self.menu_updated, "updated", f"Updated: {self.last_refresh.strftime('%H:%M:%S')}")
 
 
 if __name__ == "__main__":
@@ -2,10 +2,8 @@
 """Claude Usage Tracker - Minimal menu bar app"""
 
 import rumps
-import subprocess
-import json
-import urllib.request
-from datetime import datetime
+
+from oauth_client import get_oauth_usage, get_last_fetch_time, format_reset_time
 
 # Refresh intervals in seconds
 INTERVALS = {
@@ -15,52 +13,12 @@ INTERVALS = {
     "Every hour": 3600,
 }
 
-def get_usage():
-    """Fetch usage from OAuth endpoint."""
-    try:
-        r = subprocess.run(
-            ["security", "find-generic-password", "-s", "Claude Code-credentials", "-w"],
-            capture_output=True, text=True
-        )
-        if r.returncode != 0:
-            return None
-
-        token = json.loads(r.stdout.strip()).get("claudeAiOauth", {}).get("accessToken")
-        if not token:
-            return None
-
-        req = urllib.request.Request(
-            "https://api.anthropic.com/api/oauth/usage",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "anthropic-beta": "oauth-2025-04-20",
-                "User-Agent": "claude-code/2.1.34",
-            }
-        )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return json.loads(resp.read())
-    except:
-        return None
-
-def fmt_reset(iso):
-    """Format reset time."""
-    if not iso:
-        return "--"
-    try:
-        dt = datetime.fromisoformat(iso.replace("+00:00", "+0000").split(".")[0] + "+0000")
-        diff = dt - datetime.now(dt.tzinfo)
-        if diff.days == 0:
-            h, m = diff.seconds // 3600, (diff.seconds % 3600) // 60
-            return f"{h}h {m}m" if h else f"{m}m"
-        return dt.strftime("%b %d")
-    except:
-        return "?"
-
 class App(rumps.App):
     def __init__(self):
         super().__init__("Claude", title="...", quit_button=None)
         self.interval = 300  # Default 5 minutes
         self.timer = None
+        self._last_titles = {}
 
         # Usage menu items
         self.m5h = rumps.MenuItem("5-hour: ...")
@@ -108,32 +66,37 @@ class App(rumps.App):
     def auto_refresh(self, _):
         self.refresh(None)
 
+    def _set_title(self, item, key, title):
+        """Update a title only if it changed, to avoid redundant Cocoa updates."""
+        if self._last_titles.get(key) != title:
+            item.title = title
+            self._last_titles[key] = title
+
     def refresh(self, _):
-        self.title = "..."
-        u = get_usage()
+        u = get_oauth_usage()
         if not u:
-            self.title = "?"
+            self._set_title(self, "app", "?")
             return
 
         if h := u.get("five_hour"):
             p = int(h.get("utilization", 0))
-            self.title = f"{p}%"
-            self.m5h.title = f"5-hour: {p}% (resets {fmt_reset(h.get('resets_at', ''))})"
+            self._set_title(self, "app", f"{p}%")
+            self._set_title(self.m5h, "m5h", f"5-hour: {p}% (resets {format_reset_time(h.get('resets_at', ''))})")
 
         if d := u.get("seven_day"):
-            self.m7d.title = f"Weekly: {int(d.get('utilization', 0))}% (resets {fmt_reset(d.get('resets_at', ''))})"
+            self._set_title(self.m7d, "m7d", f"Weekly: {int(d.get('utilization', 0))}% (resets {format_reset_time(d.get('resets_at', ''))})")
 
         if s := u.get("seven_day_sonnet"):
-            self.mson.title = f"Sonnet: {int(s.get('utilization', 0))}% (resets {fmt_reset(s.get('resets_at', ''))})"
+            self._set_title(self.mson, "mson", f"Sonnet: {int(s.get('utilization', 0))}% (resets {format_reset_time(s.get('resets_at', ''))})")
         else:
-            self.mson.title = "Sonnet: --"
+            self._set_title(self.mson, "mson", "Sonnet: --")
 
         if (e := u.get("extra_usage")) and e.get("is_enabled"):
-            self.mext.title = f"Extra: ${e.get('used_credits',0)/100:.2f}/${e.get('monthly_limit',0)/100:.0f} ({int(e.get('utilization',0))}%)"
+            self._set_title(self.mext, "mext", f"Extra: ${e.get('used_credits',0)/100:.2f}/${e.get('monthly_limit',0)/100:.0f} ({int(e.get('utilization',0))}%)")
         else:
-            self.mext.title = "Extra: --"
+            self._set_title(self.mext, "mext", "Extra: --")
 
-        self.mupd.title = f"Updated: {datetime.now().strftime('%H:%M')}"
+        self._set_title(self.mupd, "mupd", f"Updated: {get_last_fetch_time().strftime('%H:%M')}")
 
 if __name__ == "__main__":
     App().run()